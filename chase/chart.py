@@ -4,14 +4,16 @@
 from __future__ import annotations
 
 from time import localtime, strftime
+from typing import TYPE_CHECKING, Any
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from matplotlib.container import BarContainer
 
 from chase.chase import Chase
 
+if TYPE_CHECKING:
+    from matplotlib.container import BarContainer
+
 __all__ = ["Chart"]
 
 
@@ -32,12 +34,12 @@ class Chart:
         self.start = start
         self.nmonths = nmonths
         self.end = end
+        self._start_str = strftime("%Y-%m-%d", localtime(start))
+        self._end_str = strftime("%Y-%m-%d", localtime(end))
 
     def _format_title(self, title: str) -> str:
 
-        _start = strftime("%Y-%m-%d", localtime(self.start))
-        _end = strftime("%Y-%m-%d", localtime(self.end))
-        return f"{title} over {self.nmonths} Months from {_start} to {_end}"
+        return f"{title} over {self.nmonths} Months from {self._start_str} to {self._end_str}"
 
     def display_category_totals(self) -> None:
         """Display a chart of category totals."""
@@ -60,27 +62,32 @@ class Chart:
     def _get_category_totals(self) -> tuple[list[str], list[int]]:
         """Return list of categories, and list of their associated totals."""
 
-        categories = []
-        totals = []
-
-        for category, cdata in sorted(
-            self.chase.categories.items(),
-            key=lambda x: -abs(x[1]["total"]),
-        ):
-            if self._is_excluded_from_charts(category):
-                continue
+        items = self._chart_items(self.chase.sorted_categories)
 
-            print(
+        self.chase.print_lines(
+            [
                 self.chase.color_text(
                     "total",
                     f"{cdata['total']:10.2f} {cdata['count']:10} Total {category}",
                 )
-            )
+                for category, cdata in items
+            ]
+        )
+        return [category for category, _ in items], [
+            round(-cdata["total"]) for _, cdata in items
+        ]
 
-            categories.append(category)
-            totals.append(round(cdata["total"] * -1))
+    def _chart_items(
+        self,
+        items: list[tuple[str, dict[str, Any]]],
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Return `items` without the categories excluded from charts."""
 
-        return categories, totals
+        return [
+            (category, cdata)
+            for category, cdata in items
+            if not self._is_excluded_from_charts(category)
+        ]
 
     def _is_excluded_from_charts(self, category: str) -> bool:
         """Return True if `category` is not for charts."""
@@ -113,27 +120,22 @@ class Chart:
     def _get_monthly_averages(self) -> tuple[list[str], list[int]]:
         """Return list of categories, and list of their associated monthly averages."""
 
-        categories = []
-        averages = []
-
-        for category, cdata in sorted(
-            self.chase.categories.items(),
-            key=lambda x: -abs(x[1]["monthly_average"]),
-        ):
-            if self._is_excluded_from_charts(category):
-                continue
+        items = self._chart_items(
+            self.chase.sort_by_magnitude(self.chase.categories.items(), "monthly_average")
+        )
 
-            print(
+        self.chase.print_lines(
+            [
                 self.chase.color_text(
                     "total",
                     f"{cdata['monthly_average']:10.2f} Monthly Average {category}",
                 )
-            )
-
-            categories.append(category)
-            averages.append(round(cdata["monthly_average"] * -1))
-
-        return categories, averages
+                for category, cdata in items
+            ]
+        )
+        return [category for category, _ in items], [
+            round(-cdata["monthly_average"]) for _, cdata in items
+        ]
 
     # -------------------------------------------------------------------------------
 
@@ -168,16 +170,9 @@ class Chart:
     def _get_monthly_totals(self, category: str) -> tuple[list[str], list[int]]:
         """Return list of months, and list of associated monthly totals, for given `category`."""
 
-        cdata = self.chase.categories[category]
-        months = []
-        totals = []
-
-        for month, total in sorted(cdata["monthly_totals"].items()):
-
-            months.append(month)
-            totals.append(round(total * -1))
-
-        return months, totals
+        monthly_totals = self.chase.categories[category]["monthly_totals"]
+        months = sorted(monthly_totals)
+        return months, [round(-monthly_totals[month]) for month in months]
 
     # -------------------------------------------------------------------------------
 
@@ -191,6 +186,9 @@ class Chart:
     ) -> None:
         # pylint: disable=too-many-arguments
         # pylint: disable=too-many-positional-arguments
+        # pylint: disable=import-outside-toplevel
+
+        import matplotlib.pyplot as plt  # deferred; slow to import.
 
         colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
         plt.figure(figsize=(12, 8))
@@ -220,6 +218,9 @@ class Chart:
     def _add_value_labels(self, bars: BarContainer) -> None:
         """Add value labels on the bars."""
 
+        # pylint: disable=import-outside-toplevel
+        import matplotlib.pyplot as plt
+
         for _bar in bars:
             height = _bar.get_height()
             value = height  # The actual value
@@ -242,25 +243,32 @@ class Chart:
         ydata: list[int],
     ) -> None:
 
+        # pylint: disable=import-outside-toplevel
+        import matplotlib.pyplot as plt  # deferred; slow to import.
+
         # pie() uses `plt.rcParams["axes.prop_cycle"].by_key()["color"]` by default.
         # plt.figure(figsize=(16, 9))  # 16:9 aspect ratio for widescreen displays
         # plt.figure(figsize=(10, 6))
         plt.figure(figsize=(12, 8))
 
         # Use absolute values for sizes
-        abs_values = np.abs(ydata)
+        values = np.asarray(ydata)
+        abs_values = np.abs(values)
 
         # Sort wedges by absolute size for better visibility
         sorted_indices = np.argsort(abs_values)[::-1]
         sorted_categories = [xdata[i] for i in sorted_indices]
-        sorted_abs_values = [abs_values[i] for i in sorted_indices]
-        sorted_values = [ydata[i] for i in sorted_indices]
+        sorted_abs_values = abs_values[sorted_indices]
+        sorted_values = values[sorted_indices]
+
+        # `autopct` is called once per wedge, in wedge order.
+        wedge_values = iter(sorted_values)
 
         # Create pie chart
         plt.pie(
             sorted_abs_values,
             labels=sorted_categories,
-            autopct=lambda pct: f"{pct:.0f}%\n${sorted_values[sorted_categories.index(plt.gca().texts[-1].get_text())]}",  # noqa
+            autopct=lambda pct: f"{pct:.0f}%\n${next(wedge_values)}",
             startangle=90,
             counterclock=False,
         )
@@ -3,14 +3,46 @@
 
 from __future__ import annotations
 
-import csv
+import re
+import sys
 from argparse import Namespace
 from collections import defaultdict
-from time import localtime, mktime, strftime, strptime
+from collections.abc import Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from itertools import islice
+from time import mktime
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
 __all__ = ["Chase"]
 
+_COLOR_RESET = "\033[0m"
+_COLOR_PREFIXES = {
+    "category": "\033[0;38;5;61m",
+    "transaction": "\033[0;32m",  # green
+    "subtotal": "\033[0;36m",  # cyan
+    "total": "\033[0;33m",  # yellow
+    "average": "\033[0;32m",  # green
+}
+
+
+def _compile_aliases(
+    aliases: dict[str, Any],
+    template: str,
+) -> tuple[re.Pattern[str], list[str]]:
+    """Return a pattern matching any of `aliases`, and the target of each group.
+
+    Args:
+        aliases:    Mapping of alias to normalized merchant.
+        template:   Format of each alternative, with `{}` for the escaped alias.
+    """
+
+    pattern = "|".join(template.format(re.escape(alias)) for alias in aliases)
+    return re.compile(pattern, re.DOTALL), [str(target) for target in aliases.values()]
+
 
 class Chase:
     """Process downloaded account transaction files from Chase Bank."""
@@ -26,6 +58,17 @@ class Chase:
         # Normalize merchants that contain...
         self.in_aliases = config.get("in_aliases", {})
 
+        # Match each table of aliases with a single pattern. Alternatives are
+        # tried in the order listed, so the first alias in the table wins.
+        self._alias_patterns = [
+            _compile_aliases(aliases, template)
+            for aliases, template in (
+                (self.startswith_aliases, "({})"),
+                (self.in_aliases, "(?=.*?({}))"),
+            )
+            if aliases
+        ]
+
         # Re-categorize these merchants...
         self.categories_by_merchant = config.get("categories_by_merchant", {})
 
@@ -39,6 +82,10 @@ class Chase:
         if self.options.no_exclude_chart_categories:
             self.chart_exclude_categories = []
 
+        # `--no-color` colors with empty strings.
+        self._color_prefixes = {} if self.options.no_color else _COLOR_PREFIXES
+        self._color_reset = "" if self.options.no_color else _COLOR_RESET
+
         #
         self.categories: dict[str, dict[str, Any]] = defaultdict(
             lambda: {  # key=category
@@ -48,7 +95,7 @@ class Chase:
                     lambda: {  # key=merchant
                         "total": 0,
                         "count": 0,
-                        "transactions": [],
+                        "rows": np.empty(0, dtype=np.intp),  # into the arrays below.
                     }
                 ),
                 "monthly_totals": defaultdict(float),  # key="YYYY-MM"
@@ -56,70 +103,108 @@ class Chase:
                 "monthly_avg2": 0,
             }
         )
-        self.filenames_by_row: dict[str, str] = {}
         self.chart_title_date: str | None = None
 
+        # Each category's merchants, in report order; see `_sorted_merchants`.
+        self._sorted_merchants_by_category: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+
+        # All transactions, column-wise; all but `dates` are kept for `--detail` only.
+        self.dates = np.empty(0, dtype=np.int64)
+        self.ymds = np.empty(0, dtype=object)  # `dates` as "YYYY-MM-DD".
+        self.amounts = np.empty(0, dtype=np.float64)
+        self.descriptions = np.empty(0, dtype=object)  # not normalized.
+
+    @cached_property
+    def sorted_categories(self) -> list[tuple[str, dict[str, Any]]]:
+        """Return `categories` items in descending order of the amount spent on each."""
+
+        return self.sort_by_magnitude(self.categories.items(), "total")
+
+    @staticmethod
+    def sort_by_magnitude(
+        items: Iterable[tuple[str, dict[str, Any]]],
+        key: str,
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Return `items` in descending order of the absolute value of each `data[key]`.
+
+        Ties keep their original order, as they would with `sorted`.
+        """
+
+        items = list(items)
+        values = np.fromiter((data[key] for _, data in items), np.float64, len(items))
+        return [items[i] for i in np.argsort(-np.abs(values), kind="stable")]
+
+    def _report_categories(self) -> list[tuple[str, dict[str, Any]]]:
+        """Return the categories to report on, limited to `--category CATEGORY`."""
+
+        if (category := self.options.category) is None:
+            return self.sorted_categories
+        if category in self.categories:
+            return [(category, self.categories[category])]
+        return []
+
     def print_report(self) -> None:
         """Print the Category/Merchant Report."""
 
-        for category, cdata in sorted(
-            self.categories.items(),
-            key=lambda x: -abs(x[1]["total"]),
-        ):
+        lines: list[str] = []
 
-            if self.options.category is not None and self.options.category != category:
-                # Limit transactions to `--category CATEGORY`.
-                continue
+        for category, cdata in islice(self._report_categories(), self.options.top):
 
             if not self.options.totals_only:
-                print(self.color_text("category", f"{' ' + category:->80}"))
-                self._print_report_merchants(cdata)
+                lines.append(self.color_text("category", f"{' ' + category:->80}"))
+                self._print_report_merchants(category, lines)
 
-            print(
+            lines.append(
                 self.color_text(
                     "total",
                     f"{cdata['total']:10.2f} {cdata['count']:10} Total {category}",
                 )
             )
 
-    def _print_report_merchants(self, cdata: dict[str, Any]) -> None:
-        """Print the count and total of each merchant within `cdata`."""
+        self.print_lines(lines)
 
-        for merchant, mdata in sorted(
-            cdata["merchants"].items(),
-            key=lambda x: -abs(x[1]["total"]),
-        ):
+    def _print_report_merchants(self, category: str, lines: list[str]) -> None:
+        """Append the count and total of each merchant within `category` to `lines`."""
+
+        for merchant, mdata in islice(self._sorted_merchants(category), self.options.top):
             if self.options.detail:
-                for row in sorted(
-                    mdata["transactions"],
-                    key=lambda x: x.get("transaction_date"),
+                rows = mdata["rows"]
+                rows = rows[np.argsort(self.dates[rows], kind="stable")]
+                # Inline `color_text`; this runs once per transaction.
+                prefix = self._color_prefixes.get("transaction", self._color_reset)
+                reset = self._color_reset
+                for date, amount, merchant in zip(
+                    self.ymds[rows].tolist(),
+                    self.amounts[rows].tolist(),
+                    self.descriptions[rows].tolist(),
                 ):
-                    amount = float(row["Amount"])
-                    date = strftime("%Y-%m-%d", localtime(row["transaction_date"]))
-                    merchant = row["Description"]  # not normalized.
-                    print(self.color_text("transaction", f"{amount:10.2f} {date} {merchant}"))
+                    lines.append(f"{prefix}{amount:10.2f} {date} {merchant}{reset}")
 
-            print(
+            lines.append(
                 self.color_text(
                     "subtotal",
                     f"{mdata['total']:10.2f} {mdata['count']:10} {merchant}",
                 )
             )
 
+    def _sorted_merchants(self, category: str) -> list[tuple[str, dict[str, Any]]]:
+        """Return merchants of `category` in descending order of the amount spent on each."""
+
+        if (merchants := self._sorted_merchants_by_category.get(category)) is None:
+            merchants = self._sorted_merchants_by_category[category] = self.sort_by_magnitude(
+                self.categories[category]["merchants"].items(), "total"
+            )
+        return merchants
+
     def print_monthly_report(self, nmonths: int) -> None:
         """Print a report of monthly totals for each category."""
 
-        for category, cdata in sorted(
-            self.categories.items(),
-            key=lambda x: -abs(x[1]["total"]),
-        ):
+        lines: list[str] = []
 
-            if self.options.category is not None and self.options.category != category:
-                # Limit transactions to `--category CATEGORY`.
-                continue
+        for category, cdata in self._report_categories():
 
             if not self.options.averages_only:
-                print(self.color_text("category", f"{' ' + category:->80}"))
+                lines.append(self.color_text("category", f"{' ' + category:->80}"))
 
             monthly_totals = cdata["monthly_totals"]
             category_total = 0
@@ -128,11 +213,11 @@ class Chase:
             for month in months:
                 total = monthly_totals[month]
                 if not self.options.averages_only:
-                    print(self.color_text("subtotal", f"{month} {total:10.2f}"))
+                    lines.append(self.color_text("subtotal", f"{month} {total:10.2f}"))
                 category_total += total
 
             if not self.options.averages_only:
-                print(
+                lines.append(
                     self.color_text(
                         "total",
                         f"{category_total:18.2f}   Total {category} over {nmonths} months",
@@ -141,7 +226,7 @@ class Chase:
 
             avg = category_total / nmonths
             cdata["monthly_average"] = avg
-            print(
+            lines.append(
                 self.color_text(
                     "average",
                     f"{avg:18.2f} Average {category} over {nmonths} months span",
@@ -152,7 +237,7 @@ class Chase:
             avg = category_total / _nmonths
             cdata["monthly_avg2"] = avg
             if not self.options.averages_only:
-                print(
+                lines.append(
                     self.color_text(
                         "average",
                         f"{avg:18.2f} Average {category} over {_nmonths} months with data",
@@ -160,16 +245,18 @@ class Chase:
                 )
 
             if self.options.detail and not self.options.averages_only:
-                self._print_monthly_report_merchants(cdata)
+                self._print_monthly_report_merchants(cdata, lines)
+
+        self.print_lines(lines)
 
-    def _print_monthly_report_merchants(self, cdata: dict[str, Any]) -> None:
-        """Print the count and total of each merchant within a `category`."""
+    def _print_monthly_report_merchants(self, cdata: dict[str, Any], lines: list[str]) -> None:
+        """Append the count and total of each merchant within a `category` to `lines`."""
 
         for merchant, mdata in sorted(
             cdata["merchants"].items(),
             key=lambda x: x[1]["total"],
         ):
-            print(f"{mdata['total']:18.2f} {mdata['count']:5d} {merchant}")
+            lines.append(f"{mdata['total']:18.2f} {mdata['count']:5d} {merchant}")
 
     def read_input_files(
         self,
@@ -179,94 +266,183 @@ class Chase:
     ) -> None:
         """Read all input files into memory."""
 
-        for filename in files:
-            with open(filename, encoding="utf-8") as fp:
-                csv_reader = csv.DictReader(fp)
-                self._read_csv_file(filename, start, end, csv_reader)
+        # Parse files concurrently; `map` keeps them in order, which matters
+        # for de-duplication below.
+        with ThreadPoolExecutor(max_workers=min(8, len(files)) or 1) as executor:
+            frames = [
+                df
+                for df in executor.map(lambda f: self._read_csv_file(f, start, end), files)
+                if not df.empty
+            ]
+        if not frames:
+            return
+
+        df = pd.concat(frames, ignore_index=True)
+
+        # A single file may contain records that look like duplicates
+        # of other records within the same file, but they're not; they
+        # are unique transactions.
+        #
+        # The user, however, may submit .csv files with overlapping dates.
+        # For example:
+        #   file1: a .csv file for the trailing 90 days retrieved 1 month ago.
+        #   file2: a .csv file for the trailing 90 days retrieved today.
+        # The first 60 days of file2 overlap with the last 60 days of file1.
+        #
+        # Silently ignore cross-file duplicates; keep every copy from the
+        # first file that contains the record.
+
+        first_filename = df.groupby("_key", sort=False)["_filename"].transform("first")
+        df = df[df["_filename"] == first_filename]
+
+        # Map aliases to normalized merchants; once per distinct description.
+        descriptions = df["Description"]
+        merchants = descriptions.map(
+            {
+                description: self._normalize_merchant(description)
+                for description in descriptions.unique()
+            }
+        )
+
+        # Re-categorize some transactions.
+        df = df.assign(
+            _merchant=merchants,
+            _category=merchants.map(self.categories_by_merchant).fillna(df["_category"]),
+        )
+
+        self._aggregate(df)
 
     def _read_csv_file(
         self,
         filename: str,
         start: int,
         end: int,
-        csv_reader: Any,
-    ) -> None:
-        """Read and process a CSV file containing transaction data.
+    ) -> pd.DataFrame:
+        """Read a CSV file containing transaction data.
 
         Args:
             filename (str): The name of the file being processed.
             start (int): Unix timestamp for the start of the date range to process.
             end (int): Unix timestamp for the end of the date range to process.
-            csv_reader (csv.DictReader): A CSV reader object for the file.
 
-        This method processes each row in the CSV file, normalizes merchants,
-        categorizes transactions, and accumulates totals and counts for reporting.
+        Returns:
+            pd.DataFrame: The raw columns of the file's transactions within the
+                date range, plus derived `_`-prefixed columns, and
+                `transaction_date`.
         """
 
-        for row in csv_reader:
-            # Credit-card accounts use `Transaction Date`.
-            # Checking accounts use `Posting Date` and `Post Date`.
-            # Skip transactions that are outside the date range.
-
-            s_date = row.get("Transaction Date", row.get("Posting Date", row.get("Post Date")))
-            date = int(mktime(strptime(s_date, "%m/%d/%Y")))
-            if (start and date < start) or (end and date >= end):
-                continue
-
-            row["transaction_date"] = date
-
-            # A single file may contain records that look like duplicates
-            # of other records within the same file, but they're not; they
-            # are unique transactions.
-            #
-            # The user, however, may submit .csv files with overlapping dates.
-            # For example:
-            #   file1: a .csv file for the trailing 90 days retrieved 1 month ago.
-            #   file2: a .csv file for the trailing 90 days retrieved today.
-            # The first 60 days of file2 overlap with the last 60 days of file1.
-            #
-            # Silently ignore cross-file duplicates.
-
-            key = str(row)
-            if key in self.filenames_by_row and filename != self.filenames_by_row[key]:
-                continue
-            self.filenames_by_row[key] = filename
-
-            # Map aliases to normalized merchants.
-            merchant = self._normalize_merchant(row["Description"])
-
-            # Re-categorize some transactions.
-            category = self.categories_by_merchant.get(
-                merchant, row.get("Category", row.get("Type", "<None>"))
+        try:
+            # Checking accounts terminate each row with an extra delimiter;
+            # a `usecols` callable drops the unnamed trailing field quietly.
+            df = pd.read_csv(
+                filename,
+                dtype=str,
+                keep_default_na=False,
+                index_col=False,
+                usecols=lambda _: True,
             )
+        except pd.errors.EmptyDataError:
+            return pd.DataFrame()
+
+        # Fingerprint the raw record, for cross-file duplicate detection.
+        df["_key"] = pd.util.hash_pandas_object(df, index=False)
+        df["_filename"] = filename
+
+        # Credit-card accounts use `Transaction Date`.
+        # Checking accounts use `Posting Date` and `Post Date`.
+        s_dates = next(
+            df[column]
+            for column in ("Transaction Date", "Posting Date", "Post Date")
+            if column in df
+        )
 
+        # Parse each distinct date once rather than once per row.
+        s_unique = s_dates.unique()
+        dates = pd.to_datetime(s_unique, format="%m/%d/%Y")
+
+        # `mktime` is local time, as are `start` and `end`.
+        timestamps = [
+            int(mktime((year, month, day, 0, 0, 0, 0, 0, -1)))
+            for year, month, day in zip(dates.year, dates.month, dates.day)
+        ]
+        df["transaction_date"] = s_dates.map(dict(zip(s_unique, timestamps)))
+        df["_ymd"] = s_dates.map(dict(zip(s_unique, dates.strftime("%Y-%m-%d"))))
+
+        # Skip transactions that are outside the date range.
+        mask = pd.Series(True, index=df.index)
+        if start:
+            mask &= df["transaction_date"] >= start
+        if end:
+            mask &= df["transaction_date"] < end
+        df = df[mask].copy()
+
+        # Truncating calendar dates to `datetime64[M]` yields "YYYY-MM" in bulk.
+        months = dates.to_numpy().astype("datetime64[M]").astype(str)
+        df["_month"] = s_dates[mask].map(dict(zip(s_unique, months)))
+        df["_amount"] = df["Amount"].astype(float)
+        df["_category"] = df.get("Category", df.get("Type", "<None>"))
+        return df
+
+    def _aggregate(self, df: pd.DataFrame) -> None:
+        """Accumulate totals and counts for reporting from transactions in `df`."""
+
+        grouped = df.groupby(["_category", "_merchant"], sort=False)
+        merchants: dict[Hashable, dict[str, Any]] = {}
+
+        for category, merchant, total, count in (
+            grouped["_amount"].agg(["sum", "count"]).reset_index().itertuples(index=False)
+        ):
             cdata = self.categories[category]
-            amount = float(row["Amount"])
-
-            cdata["total"] += amount
-            cdata["count"] += 1
-            cdata["merchants"][merchant]["total"] += amount
-            cdata["merchants"][merchant]["count"] += 1
-            cdata["merchants"][merchant]["transactions"].append(row)
+            cdata["total"] += total
+            cdata["count"] += count
+            mdata = merchants[(category, merchant)] = cdata["merchants"][merchant]
+            mdata["total"] += total
+            mdata["count"] += count
+
+        base = len(self.dates)
+        self.dates = np.concatenate((self.dates, df["transaction_date"].to_numpy(np.int64)))
+
+        # Only `--detail` lists the transactions themselves.
+        if self.options.detail:
+            self.ymds = np.concatenate((self.ymds, df["_ymd"].to_numpy(object)))
+            self.amounts = np.concatenate((self.amounts, df["_amount"].to_numpy(np.float64)))
+            self.descriptions = np.concatenate(
+                (self.descriptions, df["Description"].to_numpy(object))
+            )
+            for key, rows in grouped.indices.items():
+                mdata = merchants[key]
+                mdata["rows"] = np.concatenate((mdata["rows"], np.asarray(rows) + base))
+
+        for category, month, total in (
+            df.groupby(["_category", "_month"], sort=False)["_amount"]
+            .sum()
+            .reset_index()
+            .itertuples(index=False)
+        ):
+            self.categories[category]["monthly_totals"][month] += total
 
-            month = strftime("%Y-%m", localtime(date))
-            cdata["monthly_totals"][month] += amount
+        # Totals changed; re-sort on next use.
+        self.__dict__.pop("sorted_categories", None)
+        self._sorted_merchants_by_category.clear()
 
     def _normalize_merchant(self, merchant: str) -> str:
         """Map aliases to normalized merchants."""
 
         merchant = merchant.upper()
 
-        for alias, target in self.startswith_aliases.items():
-            if merchant.startswith(alias):
-                return str(target)
-
-        for alias, target in self.in_aliases.items():
-            if alias in merchant:
-                return str(target)
+        for pattern, targets in self._alias_patterns:
+            if (match := pattern.match(merchant)) and match.lastindex:
+                return targets[match.lastindex - 1]
 
         return merchant
 
+    @staticmethod
+    def print_lines(lines: list[str]) -> None:
+        """Print `lines` with a single write to stdout."""
+
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+
     def color_text(self, color: str, text: str) -> str:
         """Apply color to the given text.
 
@@ -279,14 +455,4 @@ class Chase:
             str: The colored text.
         """
 
-        if self.options.no_color:
-            return text
-
-        color_map = {
-            "category": "0;38;5;61m",
-            "transaction": "0;32m",  # green
-            "subtotal": "0;36m",  # cyan
-            "total": "0;33m",  # yellow
-            "average": "0;32m",  # green
-        }
-        return f"\033[{color_map.get(color, '0m')}{text}\033[0m"
+        return self._color_prefixes.get(color, self._color_reset) + text + self._color_reset
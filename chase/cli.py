@@ -1,17 +1,51 @@
 """Command line interface."""
 
+from __future__ import annotations
+
+from argparse import ArgumentTypeError
+from calendar import monthrange
+from functools import lru_cache
 from glob import glob
 from pathlib import Path
 from time import localtime, mktime, strptime
+from typing import TYPE_CHECKING
 
 from libcli import BaseCLI
 
-from chase.chart import Chart
-from chase.chase import Chase
+if TYPE_CHECKING:
+    from chase.chase import Chase
 
 __all__ = ["ChaseCLI"]
 
 
+@lru_cache(maxsize=256)
+def _parse_ymd(date_str: str) -> int:
+    """Return "YYYY-MM-DD" `date_str` as local midnight in Unix time."""
+
+    # Slice well-formed dates directly; `strptime` goes through `_strptime`'s regexes.
+    if len(date_str) == 10 and date_str[4] == date_str[7] == "-":
+        digits = date_str[:4] + date_str[5:7] + date_str[8:]
+        if digits.isascii() and digits.isdigit():
+            year, month, day = int(digits[:4]), int(digits[4:6]), int(digits[6:])
+            if year >= 1900 and 1 <= month <= 12 and 1 <= day <= monthrange(year, month)[1]:
+                return int(mktime((year, month, day, 0, 0, 0, 0, 0, -1)))
+
+    # Let `strptime` accept the rest, or reject it.
+    return int(mktime(strptime(date_str, "%Y-%m-%d")))
+
+
+def _positive_int(value: str) -> int:
+    """Return `value` as an integer greater than zero, for `argparse`."""
+
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
+
+
 class ChaseCLI(BaseCLI):
     """Command line-interface."""
 
@@ -63,6 +97,17 @@ class ChaseCLI(BaseCLI):
         )
         self.add_default_to_help(arg, self.parser)
 
+        arg = group.add_argument(
+            "--top",
+            type=_positive_int,
+            metavar="N",
+            help=(
+                "List only the top `N` Categories, and the top `N` Merchants within each "
+                "(Category/Merchant Report only)"
+            ),
+        )
+        self.add_default_to_help(arg, self.parser)
+
         group = self.parser.add_argument_group(
             "Category Monthly Report",
             self.dedent(
@@ -265,6 +310,7 @@ class ChaseCLI(BaseCLI):
         """Command line interface entry point (method)."""
 
         # pylint: disable=too-many-branches
+        # pylint: disable=import-outside-toplevel
 
         if self.options.print_sample_config:
             self._print_sample_config()
@@ -278,6 +324,10 @@ class ChaseCLI(BaseCLI):
             elif self.options.averages_only:
                 self.options.monthly = True
 
+        # Deferred; pandas is slow to import, and `--help` et al. don't need it.
+        from chase.chart import Chart
+        from chase.chase import Chase
+
         # Read all `csv` files on the command line within the date range.
         chase = Chase(self.config, self.options)
         start, end = self._get_start_end_options()
@@ -330,16 +380,9 @@ class ChaseCLI(BaseCLI):
     def _get_earliest_latest_transactions(self, chase: Chase) -> tuple[int, int]:
         """Return earliest and latest transaction dates from the actual data."""
 
-        earliest, latest = 0, 0
-        for category_data in chase.categories.values():
-            for merchant_data in category_data["merchants"].values():
-                for row in merchant_data["transactions"]:
-                    date = row["transaction_date"]
-                    if not earliest or earliest > date:
-                        earliest = date
-                    if not latest or latest < date:
-                        latest = date
-        return earliest, latest
+        if not chase.dates.size:
+            return 0, 0
+        return int(chase.dates.min()), int(chase.dates.max())
 
     def _parse_date(self, date_str: str) -> int:
         """Parse date string to Unix timestamp."""
@@ -354,18 +397,36 @@ class ChaseCLI(BaseCLI):
             st = localtime()
             return int(mktime((st.tm_year, st.tm_mon, 1, 0, 0, 0, 0, 0, -1)))
 
-        return int(mktime(strptime(date_str, "%Y-%m-%d")))
+        return _parse_ymd(date_str)
 
     def _months_between(self, start: int, end: int) -> int:
-        """Return the number of months between two Unix timestamps."""
-
-        nmonths = 0
-        while start < end:
+        """Return the number of months between two Unix timestamps.
+
+        That is, how many times `start` steps ahead one month, to midnight of the
+        same day of the month, before reaching `end`.
+        """
+
+        if start >= end:
+            return 0
+
+        st = localtime(start)
+        if st.tm_mday > 28:
+            # Days past the 28th overflow short months (Jan 31 + 1 month is Mar 3),
+            # and the day of the month drifts from there; step one month at a time.
+            nmonths = 0
+            while start < end:
+                nmonths += 1
+                st = localtime(start)
+                start = int(mktime((st.tm_year, st.tm_mon + 1, st.tm_mday, 0, 0, 0, 0, 0, -1)))
+            return nmonths
+
+        # Stepping lands on `tm_mday` of every month; reaching `end` takes either the
+        # steps into `end`'s month, or one more.
+        et = localtime(end)
+        nmonths = (et.tm_year - st.tm_year) * 12 + et.tm_mon - st.tm_mon
+        if mktime((et.tm_year, et.tm_mon, st.tm_mday, 0, 0, 0, 0, 0, -1)) < end:
             nmonths += 1
-            st = localtime(start)
-            start = int(mktime((st.tm_year, st.tm_mon + 1, st.tm_mday, 0, 0, 0, 0, 0, -1)))
-
-        return nmonths
+        return max(nmonths, 1)
 
     def _print_sample_config(self) -> None:
 
@@ -1,47 +1,35 @@
-import sys
+from collections.abc import Iterator
+from unittest.mock import patch
 
 import pytest
-from pytest_mock.plugin import MockerFixture
 
 from chase.cli import ChaseCLI
 
 
-@pytest.fixture(name="matplotlib")
-def _matplotlib(mocker: MockerFixture) -> None:
+@pytest.fixture(scope="module", autouse=True)
+def _matplotlib() -> Iterator[None]:
 
-    mocker.patch("matplotlib.pyplot.show")
+    with patch("matplotlib.pyplot.show"):
+        yield
 
 
 def run(options: list[str]) -> None:
 
-    sys.argv = ["chase"]
-    if options:
-        sys.argv += options
-    sys.argv += ["--barchart", "-s", "foy", "-e", "fom", "--use-datafiles"]
-    print(f"Running {sys.argv!r}")
-    ChaseCLI().main()
-
-
-def test_barchart(matplotlib: str) -> None:
-    _ = matplotlib  # unused-argument
-    run([])
-
-
-def test_barchart_no_exclude(matplotlib: str) -> None:
-    _ = matplotlib  # unused-argument
-    run(["--no-exclude-chart-categories"])
-
-
-def test_barchart_averages_only(matplotlib: str) -> None:
-    _ = matplotlib  # unused-argument
-    run(["--averages-only"])
-
-
-def test_barchart_monthly_averages_only(matplotlib: str) -> None:
-    _ = matplotlib  # unused-argument
-    run(["--monthly", "--moving-average"])
-
-
-def test_barchart_monthly_groceries(matplotlib: str) -> None:
-    _ = matplotlib  # unused-argument
-    run(["--monthly", "--category", "Groceries"])
+    argv = [*options, "--barchart", "-s", "foy", "-e", "fom", "--use-datafiles"]
+    print(f"Running {argv!r}")
+    ChaseCLI(argv).main()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        [],
+        ["--no-exclude-chart-categories"],
+        ["--averages-only"],
+        ["--monthly", "--moving-average"],
+        ["--monthly", "--category", "Groceries"],
+    ],
+    ids=["default", "no_exclude", "averages_only", "monthly_averages_only", "monthly_groceries"],
+)
+def test_barchart(options: list[str]) -> None:
+    run(options)
@@ -1,18 +1,16 @@
-import sys
+from argparse import Namespace
 
 import pytest
 
+from chase.chase import Chase
 from chase.cli import ChaseCLI
 
 
 def run_cli(options: list[str]) -> None:
     """Test calling the cli directly."""
 
-    sys.argv = ["chase"]
-    if options:
-        sys.argv += options
-    print(f"\nRunning {sys.argv!r}", flush=True)
-    ChaseCLI().main()
+    print(f"\nRunning {options!r}", flush=True)
+    ChaseCLI(options).main()
 
 
 def test_print_sample_config() -> None:
@@ -33,6 +31,10 @@ def test_use_datafiles_no_dates_category() -> None:
     run_cli(["--use-datafiles", "--category", "Groceries"])
 
 
+def test_use_datafiles_no_dates_unknown_category() -> None:
+    run_cli(["--use-datafiles", "--category", "NoSuchCategory"])
+
+
 def test_use_datafiles_no_dates_no_color() -> None:
     run_cli(["--use-datafiles", "--no-color"])
 
@@ -75,3 +77,35 @@ def test_monthly_averages_only_groceries() -> None:
             "Groceries",
         ]
     )
+
+
+def test_report_top() -> None:
+    run_cli(["--use-datafiles", "--top", "1"])
+
+
+def test_report_top_detail() -> None:
+    run_cli(["--use-datafiles", "--top", "1", "--detail"])
+
+
+@pytest.mark.parametrize("top", ["0", "-1", "one"])
+def test_report_top_invalid(top: str) -> None:
+    with pytest.raises(SystemExit) as err:
+        run_cli(["--use-datafiles", "--top", top])
+    assert err.value.code == 2
+
+
+def test_normalize_merchant() -> None:
+    # pylint: disable=protected-access
+    chase = Chase(
+        {
+            "startswith_aliases": {"AMZN MKTP": "AMAZON", "AMZN": "AMZN?"},
+            "in_aliases": {"NETFLIX": "NETFLIX.COM", "NET": "NET?", "A.B": "A.B"},
+        },
+        Namespace(no_exclude_chart_categories=False, no_color=True),
+    )
+    assert chase._normalize_merchant("Amzn Mktp US*AB12") == "AMAZON"
+    assert chase._normalize_merchant("amzn digital") == "AMZN?"
+    assert chase._normalize_merchant("NET NETFLIX") == "NETFLIX.COM"
+    assert chase._normalize_merchant("INTERNET") == "NET?"
+    assert chase._normalize_merchant("AXB") == "AXB"
+    assert chase._normalize_merchant("Circle K") == "CIRCLE K"
@@ -1,9 +1,17 @@
 import sys
 from subprocess import run
+from time import mktime, strptime
+from unittest.mock import patch
 
 import pytest
 
-from chase.cli import main
+from chase.cli import ChaseCLI, _parse_ymd, main
+
+
+def _local(year: int, month: int, day: int, hour: int = 0) -> int:
+    """Return local time `year`-`month`-`day` `hour`:00 in Unix time."""
+
+    return int(mktime((year, month, day, hour, 0, 0, 0, 0, -1)))
 
 
 def test_main() -> None:
@@ -57,3 +65,45 @@ def test_print_url() -> None:
     with pytest.raises(SystemExit) as err:
         main(["--print-url"])
     assert err.value.code == 0
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "nmonths"),
+    [
+        ((2025, 1, 15), (2025, 2, 15), 1),
+        ((2025, 1, 15), (2025, 2, 15, 12), 2),
+        ((2025, 1, 15), (2025, 1, 15), 0),
+        ((2025, 1, 15), (2025, 1, 10), 0),
+        ((2025, 1, 5), (2025, 1, 20), 1),
+        ((2024, 3, 10), (2025, 3, 10), 12),
+        ((2024, 11, 28), (2025, 2, 27), 3),
+        # Past the 28th, each step overflows short months; Jan 31 + 1 month is Mar 3.
+        ((2025, 1, 31), (2025, 3, 1), 1),
+        ((2025, 1, 31), (2025, 3, 4), 2),
+        ((2025, 1, 31), (2025, 1, 31), 0),
+    ],
+)
+def test_months_between(start: tuple[int, ...], end: tuple[int, ...], nmonths: int) -> None:
+    # pylint: disable=protected-access
+    assert ChaseCLI([])._months_between(_local(*start), _local(*end)) == nmonths
+
+
+def test_parse_ymd_fast_path() -> None:
+    _parse_ymd.cache_clear()
+    with patch("chase.cli.strptime", wraps=strptime) as mock_strptime:
+        assert _parse_ymd("2024-02-29") == _local(2024, 2, 29)
+    mock_strptime.assert_not_called()
+
+
+def test_parse_ymd_fallback() -> None:
+    _parse_ymd.cache_clear()
+    with patch("chase.cli.strptime", wraps=strptime) as mock_strptime:
+        assert _parse_ymd("2024-1-5") == int(mktime(strptime("2024-1-5", "%Y-%m-%d")))
+    mock_strptime.assert_called_once()
+
+
+@pytest.mark.parametrize("date_str", ["2023-02-29", "2024-13-01", "2024-00-10", "2024-01-0x"])
+def test_parse_ymd_invalid(date_str: str) -> None:
+    _parse_ymd.cache_clear()
+    with pytest.raises(ValueError, match="does not match|unconverted|out of range"):
+        _parse_ymd(date_str)